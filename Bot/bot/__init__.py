@@ -1,12 +1,28 @@
-from os import getenv, path
+from os import getenv, path, replace
+import sys, io, contextvars, tracemalloc
+from collections import Counter, deque
 import discord, requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 import asyncio, aiohttp
-import json
+import json, time, gzip, threading, hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
-import shlex, argparse
+import shlex, argparse, re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BOT_DATA_PATH_ENVAR = "BOT_DATA_PATH"
+MIN_PROFILE_INTERVAL = 0.001 # seconds between profiler stack samples
+CLICKUP_TASK_REFERENCE = re.compile(r"ClickUp Task #(\w+)")
+
+def decodeJson(payload:bytes):
+    """ Parses a response body straight from bytes, using orjson when it is installed """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 @dataclass
 class Project:
@@ -28,8 +44,523 @@ class TeamMember:
     
     def asdict(self):
         return asdict(self)
+
+@dataclass
+class IssueLink:
+    task_id: str # ClickUp task id
+    github_repo_name: str
+    issue_number: int
+    
+    @property
+    def IssueKey(self) -> str:
+        return f"{self.github_repo_name}#{self.issue_number}"
+    
+    def asdict(self):
+        return asdict(self)
+    
+
+@dataclass(slots=True)
+class TaskRecord:
+    """ The fields of a ClickUp task the bot actually uses """
+    id: str
+    name: str
+    status: str
+    status_type: str
+    priority: str
+    time_estimate: int # milliseconds
+    due_date: int # unix milliseconds, 0 if not set
+    assignees: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def fromPayload(cls, task:Dict) -> "TaskRecord":
+        status = task.get("status") or {}
+        priority = task.get("priority") or {}
+        return cls(
+            id=task["id"],
+            name=task["name"],
+            status=status.get("status", ""),
+            status_type=status.get("type", ""),
+            priority=priority.get("priority", "none"),
+            time_estimate=task.get("time_estimate") or 0,
+            due_date=int(task.get("due_date") or 0),
+            assignees=[assignee["username"] for assignee in task.get("assignees", [])]
+        )
+    
+    @property
+    def IsClosed(self) -> bool:
+        return self.status_type in ("closed", "done")
+    
+    def asdict(self):
+        return asdict(self)
+
+@dataclass(slots=True)
+class IssueRecord:
+    """ The fields of a GitHub issue the bot actually uses """
+    number: int
+    title: str
+    state: str
+    assignees: List[str] = field(default_factory=list)
+    clickup_task_id: Optional[str] = None # parsed from the issue body, which is not kept
+    
+    @classmethod
+    def fromPayload(cls, issue:Dict) -> "IssueRecord":
+        task_reference = CLICKUP_TASK_REFERENCE.search(issue.get("body") or "")
+        return cls(
+            number=issue["number"],
+            title=issue["title"],
+            state=issue["state"],
+            assignees=[assignee["login"] for assignee in issue.get("assignees", [])],
+            clickup_task_id=task_reference.group(1) if task_reference else None
+        )
+    
+    def asdict(self):
+        return asdict(self)
+
+def parseTasks(payload:bytes) -> tuple:
+    """ Parses a page of tasks, returns the records and whether it was the last page """
+    page = decodeJson(payload)
+    tasks = [TaskRecord.fromPayload(task) for task in page.get("tasks", [])]
+    return tasks, page.get("last_page", len(tasks) < 100)
+
+def parseIssues(payload:bytes) -> List[IssueRecord]:
+    # the issues endpoint also lists pull requests
+    return [IssueRecord.fromPayload(issue) for issue in decodeJson(payload) if "pull_request" not in issue]
+
+class StaleRecords(list):
+    """ Records served from the cache because refreshing them failed, only for the call that got them """
+
+@dataclass(slots=True)
+class CacheEntry:
+    value: object
+    fetched_at: float
+    restored: bool = False # loaded from a snapshot and not revalidated yet
+
+class ReadCache:
+    """ Thread safe cache for upstream reads, grouped by namespace and snapshotable to disk """
+    
+    def __init__(self, ttl:float, record_types:Dict[str, type], max_restored_age:float) -> None:
+        self.ttl = ttl
+        self.max_restored_age = max_restored_age # restored entries older than this are never served
+        self.record_types = record_types # namespace -> record class of the cached lists
+        self.revalidating = False
+        self.__entries: Dict[str, Dict[str, CacheEntry]] = {}
+        self.__lock = threading.Lock()
+    
+    def get(self, namespace:str, key:str) -> Optional[CacheEntry]:
+        """ Returns the entry if it is fresh, restored entries up to max_restored_age are served while they are being revalidated """
+        with self.__lock:
+            entry = self.__entries.get(namespace, {}).get(key)
+        
+        if entry is None:
+            return None
+        
+        entry_age = time.time() - entry.fetched_at
+        if entry_age < self.ttl or (entry.restored and self.revalidating and entry_age < self.max_restored_age):
+            return entry
+        
+        return None
+    
+    def isOutdated(self, entry:CacheEntry) -> bool:
+        """ True for entries past the ttl, which get only serves while revalidating a snapshot """
+        return time.time() - entry.fetched_at >= self.ttl
+    
+    def peek(self, namespace:str, key:str) -> Optional[CacheEntry]:
+        """ Returns the entry regardless of its age, used to serve stale data while an upstream is down """
+        with self.__lock:
+            return self.__entries.get(namespace, {}).get(key)
+    
+    def set(self, namespace:str, key:str, value) -> None:
+        with self.__lock:
+            self.__entries.setdefault(namespace, {})[key] = CacheEntry(value, time.time())
+    
+    def invalidate(self, namespace:str, prefix:str="") -> None:
+        with self.__lock:
+            entries = self.__entries.get(namespace, {})
+            for key in [key for key in entries if key.startswith(prefix)]:
+                del entries[key]
+    
+    def entries(self, namespace:str) -> List[tuple]:
+        with self.__lock:
+            return list(self.__entries.get(namespace, {}).items())
+    
+    def restoredKeys(self) -> List[tuple]:
+        with self.__lock:
+            return [(namespace, key) for namespace, entries in self.__entries.items() for key, entry in entries.items() if entry.restored]
+    
+    def dump(self) -> bytes:
+        snapshot = {
+            "saved_at": time.time(),
+            "entries": {}
+        }
+        
+        # copy the entries under the lock and serialize them outside of it, entries are replaced rather than mutated
+        with self.__lock:
+            entries_copy = {namespace: list(entries.items()) for namespace, entries in self.__entries.items()}
+        
+        for namespace, entries in entries_copy.items():
+            snapshot["entries"][namespace] = {}
+            for key, entry in entries:
+                value = entry.value
+                if namespace in self.record_types:
+                    value = [record.asdict() for record in value]
+                snapshot["entries"][namespace][key] = {"fetched_at": entry.fetched_at, "value": value}
+        
+        return gzip.compress(json.dumps(snapshot, separators=(",", ":")).encode())
+    
+    def load(self, payload:bytes) -> int:
+        snapshot = decodeJson(gzip.decompress(payload))
+        restored = 0
+        
+        with self.__lock:
+            for namespace, entries in snapshot.get("entries", {}).items():
+                record_type = self.record_types.get(namespace)
+                for key, entry in entries.items():
+                    value = entry["value"]
+                    if record_type is not None:
+                        value = [record_type(**record) for record in value]
+                    self.__entries.setdefault(namespace, {})[key] = CacheEntry(value, entry["fetched_at"], restored=True)
+                    restored += 1
+        
+        return restored
+
+class UpstreamUnavailable(Exception):
+    """ Raised instead of calling an upstream whose circuit breaker is open """
+    
+    def __init__(self, upstream:str, endpoint_class:str, retry_in:float) -> None:
+        super().__init__(f"{upstream} ({endpoint_class}) is unavailable, retrying in {retry_in:.0f}s")
+        self.upstream = upstream
+        self.endpoint_class = endpoint_class
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """ Opens after consecutive failures, then lets a single probe through once the reset timeout passes """
+    
+    def __init__(self, failure_threshold:int, reset_timeout:float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.__lock = threading.Lock()
+    
+    @property
+    def State(self) -> str:
+        if self.failures < self.failure_threshold:
+            return "closed"
+        return "half-open" if self.probing or time.time() - self.opened_at >= self.reset_timeout else "open"
+    
+    def allowRequest(self) -> float:
+        """ Returns 0 if the request may go through, otherwise the seconds left until the next probe """
+        with self.__lock:
+            if self.failures < self.failure_threshold:
+                return 0
+            
+            retry_in = self.opened_at + self.reset_timeout - time.time()
+            if self.probing or retry_in > 0:
+                return max(retry_in, 1)
+            
+            self.probing = True
+            return 0
+    
+    def recordSuccess(self) -> None:
+        with self.__lock:
+            self.failures = 0
+            self.probing = False
+    
+    def recordFailure(self) -> None:
+        with self.__lock:
+            self.failures += 1
+            self.probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+
+class UpstreamTimer:
+    """ Upstream time of one command, added to from the event loop and the upstream executor threads """
+    
+    def __init__(self) -> None:
+        self.times: Dict[str, float] = {} # 'upstream/endpoint_class' -> seconds
+        self.__lock = threading.Lock()
+    
+    def add(self, upstream_key:str, seconds:float) -> None:
+        with self.__lock:
+            self.times[upstream_key] = self.times.get(upstream_key, 0) + seconds
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self.__lock:
+            return dict(self.times)
+
+# upstream timer of the command running in the current context, only set while profiling
+current_command_upstream: contextvars.ContextVar[Optional[UpstreamTimer]] = contextvars.ContextVar("current_command_upstream", default=None)
+
+class SamplingProfiler:
+    """ Periodically samples the stacks of every thread, cheap enough to run under production traffic """
+    IDLE_FRAMES = {("selectors.py", "select"), ("threading.py", "wait"), ("thread.py", "_worker")}
+    
+    def __init__(self, interval:float) -> None:
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.__running = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self.__running.set()
+        self.__thread = threading.Thread(target=self.__sample, name="sampling-profiler", daemon=True)
+        self.__thread.start()
+    
+    def stop(self) -> None:
+        self.__running.clear()
+        if self.__thread is not None:
+            self.__thread.join()
+    
+    def __sample(self) -> None:
+        own_thread = threading.get_ident()
+        while self.__running.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                
+                if (path.basename(frame.f_code.co_filename), frame.f_code.co_name) in self.IDLE_FRAMES:
+                    continue
+                
+                stack = []
+                while frame is not None:
+                    stack.append(f"{frame.f_code.co_name} ({path.basename(frame.f_code.co_filename)}:{frame.f_code.co_firstlineno})")
+                    frame = frame.f_back
+                
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+            
+            time.sleep(self.interval)
+    
+    def topFunctions(self, limit:int) -> List[tuple]:
+        """ Returns (function, self samples, total samples) sorted by self samples """
+        self_samples, total_samples = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            self_samples[stack[-1]] += count
+            for function in set(stack):
+                total_samples[function] += count
+        
+        return [(function, count, total_samples[function]) for function, count in self_samples.most_common(limit)]
+    
+    def collapsedStacks(self) -> str:
+        """ Stacks in the collapsed format understood by flamegraph tools """
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common())
+
+@dataclass
+class CommandSample:
+    command: str
+    duration: float # seconds
+    upstream: Dict[str, float] = field(default_factory=dict) # 'upstream/endpoint_class' -> seconds
+
+@dataclass
+class ProfileSession:
+    channel: object # discord channel the report is sent to
+    duration: float
+    max_commands: int
+    profiler: SamplingProfiler
+    started_at: float = field(default_factory=time.time)
+    commands: List[CommandSample] = field(default_factory=list)
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+    
+    def recordCommand(self, sample:CommandSample) -> None:
+        self.commands.append(sample)
+        if len(self.commands) >= self.max_commands:
+            self.finished.set()
+
+@dataclass
+class OutboundMessage:
+    content: Optional[str]
+    kwargs: Dict
+    coalesce: bool
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.perf_counter)
+
+@dataclass
+class ChannelOutbox:
+    messages: deque = field(default_factory=deque)
+    send_times: deque = field(default_factory=deque) # perf_counter of the recent sends, for pacing
+    worker: Optional[asyncio.Task] = None
+    sent_messages: int = 0
+    sends: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+class OutboundQueue:
+    """ Per channel send queues that merge consecutive small messages and pace sends under discord's channel rate limit """
+    MESSAGE_LIMIT = 2000
+    
+    def __init__(self, rate:int, per:float) -> None:
+        self.rate = rate
+        self.per = per
+        self.outboxes: Dict[int, ChannelOutbox] = {}
+        self.idle_totals = ChannelOutbox() # stats of the outboxes dropped once their channel went idle
+    
+    def put(self, channel, content:Optional[str]=None, coalesce:bool=True, **kwargs) -> asyncio.Future:
+        """ Queues a message, the returned future resolves to the sent discord message, the last one if the content was split """
+        chunks = self.splitContent(content) if content is not None and len(content) > self.MESSAGE_LIMIT else [content]
+        outbox = self.outboxes.setdefault(channel.id, ChannelOutbox())
+        for chunk_index, chunk in enumerate(chunks):
+            future = asyncio.get_running_loop().create_future()
+            # mark failures as retrieved, most callers never await their message
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            # files and embeds go with the last chunk
+            chunk_kwargs = kwargs if chunk_index == len(chunks) - 1 else {}
+            outbox.messages.append(OutboundMessage(chunk, chunk_kwargs, coalesce and not chunk_kwargs and chunk is not None, future))
+        
+        if outbox.worker is None or outbox.worker.done():
+            outbox.worker = asyncio.create_task(self.__drain(channel, outbox))
+        
+        return future
+    
+    def splitContent(self, content:str) -> List[str]:
+        """ Splits content over the message limit on line boundaries, code blocks cut between chunks are closed and reopened """
+        piece_length = self.MESSAGE_LIMIT // 2
+        chunks, chunk_lines, chunk_length = [], [], 0
+        fence = None # opening line of the code block the current line is in
+        for line in content.split("\n"):
+            for piece in [line[start:start + piece_length] for start in range(0, len(line), piece_length)] or [""]:
+                # leave room for the closing fence
+                if chunk_lines and chunk_length + len(piece) + 4 > self.MESSAGE_LIMIT:
+                    chunks.append("\n".join(chunk_lines + (["```"] if fence else [])))
+                    chunk_lines = [fence] if fence else []
+                    chunk_length = len(fence) + 1 if fence else 0
+                
+                chunk_lines.append(piece)
+                chunk_length += len(piece) + 1
+                if piece.count("```") % 2:
+                    fence = None if fence else (piece.strip() if piece.strip().startswith("```") else "```")
+        
+        if chunk_lines:
+            chunks.append("\n".join(chunk_lines))
+        return chunks
     
+    async def __drain(self, channel, outbox:ChannelOutbox) -> None:
+        while True:
+            while outbox.messages:
+                batch = [outbox.messages.popleft()]
+                if batch[0].coalesce:
+                    merged_length = len(batch[0].content)
+                    while outbox.messages and outbox.messages[0].coalesce and merged_length + 1 + len(outbox.messages[0].content) <= self.MESSAGE_LIMIT:
+                        merged_length += 1 + len(outbox.messages[0].content)
+                        batch.append(outbox.messages.popleft())
+                
+                await self.__waitForSlot(outbox)
+                try:
+                    sent_message = await channel.send("\n".join(message.content for message in batch) if batch[0].coalesce else batch[0].content, **batch[0].kwargs)
+                except Exception as e:
+                    print(f"Error sending message to channel {channel.id}: {e}")
+                    for message in batch:
+                        message.future.set_exception(e)
+                    await self.__notifyFailure(channel, outbox, e)
+                    continue
+                
+                sent_at = time.perf_counter()
+                outbox.sends += 1
+                for message in batch:
+                    latency = sent_at - message.queued_at
+                    outbox.sent_messages += 1
+                    outbox.total_latency += latency
+                    outbox.max_latency = max(outbox.max_latency, latency)
+                    message.future.set_result(sent_message)
+            
+            # the outbox holds the channel's pacing window, keep it until the window passed so a new outbox can't send past the rate
+            idle_wait = outbox.send_times[-1] + self.per - time.perf_counter() if outbox.send_times else 0
+            if idle_wait <= 0:
+                break
+            await asyncio.sleep(idle_wait)
+        
+        if self.outboxes.get(channel.id) is outbox:
+            del self.outboxes[channel.id]
+            self.idle_totals.sends += outbox.sends
+            self.idle_totals.sent_messages += outbox.sent_messages
+            self.idle_totals.total_latency += outbox.total_latency
+            self.idle_totals.max_latency = max(self.idle_totals.max_latency, outbox.max_latency)
+    
+    async def __notifyFailure(self, channel, outbox:ChannelOutbox, error:Exception) -> None:
+        """ Tells the channel a reply was lost, the failed message itself is not retried """
+        await self.__waitForSlot(outbox)
+        try:
+            await channel.send(f"```arm\nError: a reply could not be sent ({type(error).__name__})\n```")
+        except Exception as e:
+            print(f"Error sending failure notice to channel {channel.id}: {e}")
+    
+    async def __waitForSlot(self, outbox:ChannelOutbox) -> None:
+        while len(outbox.send_times) >= self.rate:
+            wait_time = outbox.send_times[0] + self.per - time.perf_counter()
+            if wait_time <= 0:
+                outbox.send_times.popleft()
+            else:
+                await asyncio.sleep(wait_time)
+        
+        outbox.send_times.append(time.perf_counter())
+
+class WorkloadTable:
+    """ Per list open task aggregates by assignee, status and priority, replaced whenever a list is refetched """
+    DIMENSIONS = ("assignee", "status", "priority")
+    
+    def __init__(self) -> None:
+        self.list_tables: Dict[str, Dict[str, Dict[str, list]]] = {} # list_id -> dimension -> key -> [count, estimate ms]
+        self.fetched_at: Dict[str, float] = {} # list_id -> unix time of the tasks the table was built from
+        self.__lock = threading.Lock()
     
+    def updateList(self, list_id:str, tasks:List[TaskRecord], fetched_at:float=None) -> None:
+        # build the columns first, one row per (task, assignee) so every assignee carries the task's estimate
+        assignee_column, status_column, priority_column, estimate_column, primary_column = [], [], [], [], []
+        for task in tasks:
+            if task.IsClosed:
+                continue
+            for assignee_index, assignee in enumerate(task.assignees or ["unassigned"]):
+                assignee_column.append(assignee)
+                status_column.append(task.status)
+                priority_column.append(task.priority)
+                estimate_column.append(task.time_estimate)
+                primary_column.append(assignee_index == 0)
+        
+        list_table = {dimension: {} for dimension in self.DIMENSIONS}
+        for dimension, column in zip(self.DIMENSIONS, (assignee_column, status_column, priority_column)):
+            dimension_table = list_table[dimension]
+            for key, estimate, is_primary in zip(column, estimate_column, primary_column):
+                # status and priority count each task once, not once per assignee
+                if dimension != "assignee" and not is_primary:
+                    continue
+                totals = dimension_table.setdefault(key, [0, 0])
+                totals[0] += 1
+                totals[1] += estimate
+        
+        with self.__lock:
+            self.list_tables[str(list_id)] = list_table
+            self.fetched_at[str(list_id)] = fetched_at or time.time()
+    
+    def age(self, list_id:str) -> Optional[float]:
+        """ Seconds since the list's tasks were fetched, None if there is no table for it """
+        with self.__lock:
+            fetched_at = self.fetched_at.get(str(list_id))
+        return None if fetched_at is None else time.time() - fetched_at
+    
+    def dropList(self, list_id:str) -> None:
+        with self.__lock:
+            self.list_tables.pop(str(list_id), None)
+            self.fetched_at.pop(str(list_id), None)
+    
+    def clear(self) -> None:
+        with self.__lock:
+            self.list_tables.clear()
+            self.fetched_at.clear()
+    
+    def totals(self, list_ids:List[str]) -> Dict[str, Dict[str, list]]:
+        combined = {dimension: {} for dimension in self.DIMENSIONS}
+        with self.__lock:
+            list_tables = [self.list_tables[str(list_id)] for list_id in list_ids if str(list_id) in self.list_tables]
+        
+        for list_table in list_tables:
+            for dimension, dimension_table in list_table.items():
+                for key, (count, estimate) in dimension_table.items():
+                    totals = combined[dimension].setdefault(key, [0, 0])
+                    totals[0] += count
+                    totals[1] += estimate
+        
+        return combined
 
 class DiscordBot(discord.Client):
     
@@ -40,6 +571,8 @@ class DiscordBot(discord.Client):
         self.admin_passphrase = getenv("ADMIN_PASSPHRASE", "")
         self.projects: Dict[str, Project] = {}
         self.team_members: Dict[int, List[TeamMember]] = {}
+        self.issue_links: Dict[str, IssueLink] = {} # task_id -> IssueLink
+        self.task_by_issue: Dict[str, str] = {} # 'repo#issue_number' -> task_id
         assert self.passphrase, "PASSPHRASE is not set"
         assert self.admin_passphrase, "ADMIN_PASSPHRASE is not set"
         
@@ -57,6 +590,30 @@ class DiscordBot(discord.Client):
         assert self.credentials["github_token"], "GITHUB_TOKEN is not set"
         assert self.credentials["clickup_token"], "CLICKUP_TOKEN is not set"
         
+        self.overview_concurrency = int(getenv("OVERVIEW_CONCURRENCY", "8"))
+        self.overview_timeout = float(getenv("OVERVIEW_TIMEOUT", "20"))
+        self.upstream_executor = ThreadPoolExecutor(max_workers=self.overview_concurrency * 2, thread_name_prefix="upstream")
+        # overview gets its own workers so boards, workload and revalidation can't queue its jobs past their timeout
+        self.overview_executor = ThreadPoolExecutor(max_workers=self.overview_concurrency * 3, thread_name_prefix="overview")
+        
+        self.cache = ReadCache(float(getenv("CACHE_TTL", "300")), {"list_tasks": TaskRecord, "repo_issues": IssueRecord}, float(getenv("CACHE_MAX_RESTORED_AGE", "86400")))
+        self.cache_snapshot_interval = float(getenv("CACHE_SNAPSHOT_INTERVAL", "600"))
+        self.background_tasks: List[asyncio.Task] = []
+        
+        self.upstream_timeout = (float(getenv("UPSTREAM_CONNECT_TIMEOUT", "3.05")), float(getenv("UPSTREAM_READ_TIMEOUT", "10")))
+        self.breaker_failure_threshold = int(getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+        self.breaker_reset_timeout = float(getenv("BREAKER_RESET_TIMEOUT", "30"))
+        self.circuit_breakers: Dict[tuple, CircuitBreaker] = {} # (upstream, endpoint_class) -> breaker
+        
+        self.profile_session: Optional[ProfileSession] = None
+        
+        self.board_min_interval = float(getenv("BOARD_MIN_INTERVAL", "60"))
+        self.board_max_interval = float(getenv("BOARD_MAX_INTERVAL", "1800"))
+        self.board_next_refresh: Dict[tuple, float] = {} # (guild_id, project_name) -> unix time
+        
+        self.workload = WorkloadTable()
+        self.outbound = OutboundQueue(int(getenv("SEND_RATE", "5")), float(getenv("SEND_PER", "5")))
+        
         self.__token = token
         
         self.loadBotData()
@@ -81,9 +638,10 @@ class DiscordBot(discord.Client):
             }
         }
         
-        response = requests.put(clickup_task_api, headers=clickup_task_headers, json=task_data)
+        response = self.upstreamRequest("clickup", "task", "PUT", clickup_task_api, headers=clickup_task_headers, json=task_data)
 
         if response.ok:
+            self.invalidateListTasks(self.findTaskLists(args.task_id))
             return f"Task {args.task_id} assigned to {args.assign}"
         else:
             return f"Error assigning task {args.task_id} to {args.assign}: {response.text}"
@@ -91,16 +649,16 @@ class DiscordBot(discord.Client):
     async def commandAddDeveloper(self, project_name:str, github_user:str, message:discord.Message):
         github_user_data = self.getGithubUserData(github_user)
         if github_user_data is None:
-            await message.channel.send(f"```arm\n'{github_user}' user does not exist on GitHub\n```")
+            self.sendMessage(message.channel, f"```arm\n'{github_user}' user does not exist on GitHub\n```")
             return
         
         if project_name not in self.projects:
-            await message.channel.send(f"```arm\n'{project_name}' project does not exist\n```")
+            self.sendMessage(message.channel, f"```arm\n'{project_name}' project does not exist\n```")
             return
 
         project = self.projects[project_name]
         project.assignees.append(github_user)
-        await message.reply(f"Added '{github_user_data['html_url']}' to '{project_name}'")
+        self.sendMessage(message.channel, f"Added '{github_user_data['html_url']}' to '{project_name}'", reference=message)
         self.saveProjects()    
     
     def commandCreateTask(self, args:argparse.Namespace) -> str:
@@ -121,37 +679,63 @@ class DiscordBot(discord.Client):
         }
         
         session = requests.session()
-        response = session.post(clickup_api_url, headers=headers, data=json.dumps(task_data))
+        response = self.upstreamRequest("clickup", "tasks", "POST", clickup_api_url, session=session, headers=headers, data=json.dumps(task_data))
         session.close()
         
         if response.ok:
+            self.invalidateListTasks([list_id])
             return f"Task '{args.task_name}' created successfully"
         else:
             return f"Error '{response.status_code}' creating task: {response.text}"
         
-    def commandClickupTeam(self) -> str:
+    def commandClickupTeam(self, refresh:bool=False) -> str:
+        cached_team = None if refresh else self.cache.get("clickup_team", "teams")
+        if cached_team is not None:
+            stale_notice = "```arm\nShowing cached data from before the restart, refreshing it\n```" if self.cache.isOutdated(cached_team) else ""
+            return stale_notice + self.formatClickUpTeam(cached_team.value)
+        
         clickup_team_api = f"https://api.clickup.com/api/v2/team"
         clickup_team_headers = {
             "Authorization": f"{self.ClickUpToken}",
             "Content-Type": "application/json"
         }
         
-        response = requests.get(clickup_team_api, headers=clickup_team_headers)
+        try:
+            response = self.upstreamRequest("clickup", "team", "GET", clickup_team_api, headers=clickup_team_headers)
+        except (UpstreamUnavailable, requests.RequestException) as e:
+            stale_team = self.cache.peek("clickup_team", "teams")
+            if stale_team is None:
+                raise
+            return f"```arm\nClickUp unavailable, showing stale data: {e}\n```" + self.formatClickUpTeam(stale_team.value)
+        
         if response.ok:
-            team_repr = "```sql\n"
-            team = json.loads(response.text)["teams"]
-            if not len(team):
-                return "No teams found"
-            
-            for member in team[0]['members']:
-                team_repr += f"{'id':>15}: {member['user']['id']}\n{'username':>15}: {member['user']['username']}\n{'email':>15}: {member['user']['email']}\n{'role':>15}: {member['user']['role']}\n"
-                if 'invited_by' in member:
-                    team_repr += f"{'invited_by':>15}: {member['invited_by']['username']}\n"
-                team_repr += f"\n{'-'*30}\n"
-            team_repr += "```"
-            return team_repr
+            team = decodeJson(response.content)["teams"]
+            members = []
+            if len(team):
+                # only the first team is shown, keep just the fields it renders
+                for member in team[0]['members']:
+                    slim_member = {"user": {field_name: member['user'][field_name] for field_name in ("id", "username", "email", "role")}}
+                    if 'invited_by' in member:
+                        slim_member['invited_by'] = {"username": member['invited_by']['username']}
+                    members.append(slim_member)
+            
+            self.cache.set("clickup_team", "teams", members)
+            return self.formatClickUpTeam(members)
         else:
             return f"Error '{response.status_code}' getting team: {response.text}"
+    
+    def formatClickUpTeam(self, members:List) -> str:
+        team_repr = "```sql\n"
+        if not len(members):
+            return "No teams found"
+        
+        for member in members:
+            team_repr += f"{'id':>15}: {member['user']['id']}\n{'username':>15}: {member['user']['username']}\n{'email':>15}: {member['user']['email']}\n{'role':>15}: {member['user']['role']}\n"
+            if 'invited_by' in member:
+                team_repr += f"{'invited_by':>15}: {member['invited_by']['username']}\n"
+            team_repr += f"\n{'-'*30}\n"
+        team_repr += "```"
+        return team_repr
                     
     async def commandCreateFeature(self, message_obj: discord.Message, *args) -> None:
         if not self.isUserAdmin(message_obj):
@@ -166,12 +750,12 @@ class DiscordBot(discord.Client):
         
         clickup_id = project.clickup_id
         clickup_task = self.createClickUpTask(clickup_id, task_name, task_description)
-        if self.createGithubIssue(project_name, task_name, clickup_task["id"], task_description) <= 299:
+        if self.createGithubIssue(project_name, task_name, clickup_task.get("id"), task_description) <= 299:
             print(f"Created Github issue {task_name}")
-            await message_obj.channel.send(f"Created issue '{task_name}'")
+            self.sendMessage(message_obj.channel, f"Created issue '{task_name}'")
         else:
             print("Error creating Github issue")
-            await message_obj.channel.send(f"Error creating Github issue, sorry for the inconvenience")
+            self.sendMessage(message_obj.channel, f"Error creating Github issue, sorry for the inconvenience")
     
     def commandCreateMember(self, args:argparse.Namespace) -> str:
         server_team_members = self.team_members.get(args.server_id, [])
@@ -184,12 +768,12 @@ class DiscordBot(discord.Client):
 
     async def commandListDevelopers(self, project_name:str, message_obj: discord.Message) -> None:
         if project_name not in self.projects:
-            await message_obj.channel.send(f"```arm\n'{project_name}' project does not exist\n```")
+            self.sendMessage(message_obj.channel, f"```arm\n'{project_name}' project does not exist\n```")
             return
         
         developers = self.getDevelopers(project_name)
         developers_str = "\n".join([f"- {developer}" for developer in developers])
-        await message_obj.channel.send(f"```yaml\n{developers_str}\n```")
+        self.sendMessage(message_obj.channel, f"```yaml\n{developers_str}\n```")
     
     def commandGetListMemebers(self, args:argparse.Namespace) -> str:
         list_id = args.list_id
@@ -200,11 +784,11 @@ class DiscordBot(discord.Client):
         }
         
         session = requests.session()
-        response = session.get(clickup_api_url, headers=headers)
+        response = self.upstreamRequest("clickup", "lists", "GET", clickup_api_url, session=session, headers=headers)
         session.close()
         
         if response.ok:
-            memebers = json.loads(response.text).get("members", [])
+            memebers = decodeJson(response.content).get("members", [])
             list_message = "```sql\n"
             list_message += "\n".join([f"{member['username']} - id: {member['id']} - email: {member['email']}" for member in memebers])
             list_message += "\n```"
@@ -212,16 +796,204 @@ class DiscordBot(discord.Client):
         else:
             return f"Error '{response.status_code}' getting list members: {response.text}"
     
-    async def commandListIssues(self, project_name:str, message_obj: discord.Message) -> None:
-        issues_data = self.getProjectIssues(project_name)
+    async def commandListIssues(self, project_name:str, message_obj: discord.Message, refresh:bool=False) -> None:
+        issues_data = self.getProjectIssues(project_name, refresh=refresh)
         issues_list_message_content = ""
         for issue in issues_data:
-            issues_list_message_content += f"-> {issue['title']} - id:{issue['number']} - state:{issue['state']} - assignees:"
-            for assignee in issue['assignees']:
-                issues_list_message_content += f" {assignee['login']},"
+            issues_list_message_content += f"-> {issue.title} - id:{issue.number} - state:{issue.state} - assignees:"
+            for assignee in issue.assignees:
+                issues_list_message_content += f" {assignee},"
             issues_list_message_content = issues_list_message_content[:-1] + "\n\n"
         
-        await message_obj.channel.send(f"```yaml\n{issues_list_message_content}\n```")
+        stale_notice = ""
+        if isinstance(issues_data, StaleRecords):
+            stale_notice = "```arm\nGitHub unavailable, showing stale data\n```"
+        
+        self.sendMessage(message_obj.channel, f"{stale_notice}```yaml\n{issues_list_message_content}\n```")
+    
+    def commandLinkedIssue(self, task_id:str) -> str:
+        link = self.issue_links.get(task_id)
+        if link is None:
+            return f"```arm\nNo github issue linked to task '{task_id}'\n```"
+        
+        return f"```yaml\ntask {task_id} -> https://github.com/{self.GitHubUser}/{link.github_repo_name}/issues/{link.issue_number}\n```"
+    
+    def commandLinkedTask(self, project_name:str, issue_number:str) -> str:
+        if project_name not in self.projects:
+            return f"```arm\n'{project_name}' project does not exist\n```"
+        
+        issue_key = f"{self.projects[project_name].github_repo_name}#{issue_number}"
+        task_id = self.task_by_issue.get(issue_key)
+        if task_id is None:
+            return f"```arm\nNo clickup task linked to issue '{issue_key}'\n```"
+        
+        return f"```yaml\n{issue_key} -> https://app.clickup.com/t/{task_id}\n```"
+    
+    def commandScanIssueLinks(self, scanned_links:List[tuple]) -> str:
+        found = 0
+        for task_id, github_repo_name, issue_number in scanned_links:
+            if self.linkIssue(task_id, github_repo_name, issue_number):
+                found += 1
+        
+        if found:
+            self.saveIssueLinks()
+        
+        return f"Found {found} new task links, {len(self.issue_links)} links indexed"
+    
+    async def commandOverview(self, message_obj: discord.Message) -> None:
+        if not self.projects:
+            self.sendMessage(message_obj.channel, "```arm\nNo projects registered\n```")
+            return
+        
+        semaphore = asyncio.Semaphore(self.overview_concurrency)
+        
+        def releaseSlot(fetches:asyncio.Future) -> None:
+            semaphore.release()
+            if not fetches.cancelled():
+                fetches.exception() # timed out fetches are never awaited again
+        
+        async def fetchProjectSummary(project_name:str) -> tuple:
+            await semaphore.acquire()
+            project = self.projects[project_name]
+            fetches = asyncio.gather(
+                self.runUpstream(self.getProjectTasks, project_name, True, executor=self.overview_executor),
+                self.runUpstream(self.getProjectIssues, project_name, executor=self.overview_executor),
+                self.runUpstream(self.getRepoClosedIssueCount, project.github_repo_name, executor=self.overview_executor)
+            )
+            # a timeout can't stop the executor threads, so the slot is only released once they finish
+            fetches.add_done_callback(releaseSlot)
+            try:
+                tasks, issues, closed_issue_count = await asyncio.wait_for(asyncio.shield(fetches), timeout=self.overview_timeout)
+            except asyncio.TimeoutError:
+                return project_name, f"timed out after {self.overview_timeout:g}s"
+            except Exception as e:
+                return project_name, f"error: {e}"
+            
+            summary = self.summarizeProject(tasks, issues, closed_issue_count)
+            if closed_issue_count is None:
+                summary["closed_issues"] = "?"
+            summary["stale"] = isinstance(tasks, StaleRecords) or isinstance(issues, StaleRecords)
+            return project_name, summary
+        
+        header = f"{'project':<20} {'tasks o/c':>10} {'issues o/c':>11} {'unassigned':>11} {'overdue':>14}\n"
+        lines = []
+        rendered_lines = 0 # lines already shown on overview_message
+        last_edit = time.monotonic()
+        overview_message = await self.sendMessage(message_obj.channel, f"```sql\n{header}```", coalesce=False)
+        
+        for next_summary in asyncio.as_completed([fetchProjectSummary(project_name) for project_name in self.projects]):
+            project_name, summary = await next_summary
+            if isinstance(summary, str):
+                line = f"{project_name:<20} {summary}\n"
+            else:
+                line = f"{project_name:<20} {summary['open_tasks']:>4}/{summary['closed_tasks']:<5} {summary['open_issues']:>4}/{summary['closed_issues']:<6} {summary['unassigned']:>11} {summary['overdue']:>4} ({summary['overdue_hours']:.1f}h){' stale' if summary['stale'] else ''}\n"
+            
+            if len(header) + len("".join(lines)) + len(line) > 1980:
+                # discord messages are limited to 2000 characters, continue on a new message
+                if rendered_lines < len(lines):
+                    await overview_message.edit(content=f"```sql\n{header}{''.join(lines)}```")
+                lines, rendered_lines = [line], 1
+                overview_message = await self.sendMessage(message_obj.channel, f"```sql\n{header}{line}```", coalesce=False)
+                continue
+            
+            lines.append(line)
+            # edits share the channel's rate limit, so results are batched into at most one edit per second
+            if time.monotonic() - last_edit >= 1:
+                await overview_message.edit(content=f"```sql\n{header}{''.join(lines)}```")
+                rendered_lines, last_edit = len(lines), time.monotonic()
+        
+        if rendered_lines < len(lines):
+            await overview_message.edit(content=f"```sql\n{header}{''.join(lines)}```")
+    
+    async def commandPinBoard(self, project_name:str, message_obj: discord.Message) -> None:
+        if project_name not in self.projects:
+            self.sendMessage(message_obj.channel, f"```arm\n'{project_name}' project does not exist\n```")
+            return
+        
+        guild_id = str(message_obj.guild.id)
+        boards = self.Servers[guild_id].setdefault("boards", {})
+        if project_name in boards:
+            await self.refreshBoard(guild_id, project_name, force=True)
+            self.sendMessage(message_obj.channel, f"Board for '{project_name}' already exists, refreshed it")
+            return
+        
+        board_content = await self.runUpstream(self.renderBoard, project_name)
+        board_message = await self.sendMessage(message_obj.channel, board_content, coalesce=False)
+        try:
+            await board_message.pin()
+        except discord.HTTPException as e:
+            print(f"Error pinning board for {project_name}: {e}")
+        
+        boards[project_name] = {
+            "channel_id": str(message_obj.channel.id),
+            "message_id": str(board_message.id),
+            "content_hash": hashlib.sha1(board_content.encode()).hexdigest(),
+            "interval": self.board_min_interval
+        }
+        self.board_next_refresh[(guild_id, project_name)] = time.time() + self.board_min_interval
+        self.saveConfig()
+    
+    async def commandProfile(self, args:argparse.Namespace, message_obj: discord.Message) -> None:
+        if self.profile_session is not None:
+            self.sendMessage(message_obj.channel, "```arm\nA profile is already running\n```")
+            return
+        
+        profiler = SamplingProfiler(args.interval)
+        self.profile_session = ProfileSession(message_obj.channel, args.seconds, args.commands, profiler)
+        
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(10)
+        profiler.start()
+        
+        self.sendMessage(message_obj.channel, f"Profiling for {args.seconds:g}s or {args.commands} commands")
+        finish_task = asyncio.create_task(self.finishProfile(self.profile_session, was_tracing))
+        self.background_tasks.append(finish_task)
+        finish_task.add_done_callback(self.background_tasks.remove)
+    
+    async def finishProfile(self, profile_session:ProfileSession, was_tracing:bool) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            # snapshots walk every traced allocation, keep them off the event loop
+            allocations_start = await loop.run_in_executor(None, tracemalloc.take_snapshot)
+            try:
+                await asyncio.wait_for(profile_session.finished.wait(), timeout=profile_session.duration)
+            except asyncio.TimeoutError:
+                pass
+            
+            allocations = await loop.run_in_executor(None, lambda: tracemalloc.take_snapshot().compare_to(allocations_start, "lineno"))
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+            await loop.run_in_executor(None, profile_session.profiler.stop)
+            self.profile_session = None
+        
+        elapsed = time.time() - profile_session.started_at
+        top_functions = profile_session.profiler.topFunctions(25)
+        slowest_commands = sorted(profile_session.commands, key=lambda sample: sample.duration, reverse=True)[:10]
+        
+        def formatFunctions(limit:int) -> str:
+            return "".join(f"{self_count:>7} {total_count:>7}  {function}\n" for function, self_count, total_count in top_functions[:limit])
+        
+        def formatAllocations(limit:int) -> str:
+            return "".join(f"{stat.size_diff/1024:>+10.1f}KiB {stat.count_diff:>+7}  {stat.traceback[0].filename}:{stat.traceback[0].lineno}\n" for stat in allocations[:limit])
+        
+        def formatCommands(limit:int) -> str:
+            commands_repr = ""
+            for sample in slowest_commands[:limit]:
+                upstream_repr = ", ".join(f"{upstream_key} {seconds:.2f}s" for upstream_key, seconds in sorted(sample.upstream.items(), key=lambda item: item[1], reverse=True))
+                commands_repr += f"{sample.duration:>7.2f}s  {sample.command[:60]}  [{upstream_repr or 'no upstream calls'}]\n"
+            return commands_repr
+        
+        header = f"profiled {elapsed:.1f}s, {len(profile_session.commands)} commands, {profile_session.profiler.samples} stack samples\n"
+        summary = f"```sql\n{header}\n-- top functions (self, total samples)\n{formatFunctions(5)}\n-- allocation hotspots\n{formatAllocations(5)}\n-- slowest commands\n{formatCommands(5)}```"
+        report = f"{header}\n# top functions (self, total samples)\n{formatFunctions(25)}\n# allocation hotspots\n{formatAllocations(25)}\n# slowest commands\n{formatCommands(10)}\n# collapsed stacks\n{profile_session.profiler.collapsedStacks()}\n"
+        
+        if len(summary) > 2000:
+            summary = summary[:1990] + "\n...```"
+        
+        report_file = discord.File(io.BytesIO(report.encode()), filename=f"profile-{int(profile_session.started_at)}.txt")
+        self.sendMessage(profile_session.channel, summary, file=report_file)
     
     def commandListProjects(self) -> str:
         projects_str = "```sql\n"
@@ -238,34 +1010,97 @@ class DiscordBot(discord.Client):
             return f"```arm\n'{project_name}' project does not exist\n```"
 
         list_id = self.projects[project_name].clickup_id
-        clickup_api_url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
+        tasks = self.getListTasks(list_id, refresh=args.refresh)
+        if self.cache.peek("list_tasks", f"{list_id}:False") is None:
+            return f"```arm\nError getting tasks for list {list_id}\n```"
         
-        headers = {
-            'Authorization': f"{self.ClickUpToken}",
-            'Content-Type': 'application/json'
-        }
+        stale_notice = ""
+        if isinstance(tasks, StaleRecords):
+            stale_notice = "```arm\nClickUp unavailable, showing stale data\n```"
         
-        response = requests.get(clickup_api_url, headers=headers)
+        message_content = stale_notice + "```sql\n"
         
-        if response.ok:
-            message_content = "```sql\n"
-            
-            for task in json.loads(response.text).get("tasks", []):
-                time_estimate = task.get("time_estimate", None)
-                time_estimate = time_estimate/1000 if time_estimate else 0
-                priority = "none"
-                if task.get("priority", None):
-                    priority = task['priority'].get('priority', 'none')
-                message_content += f"{'name':>15}: {task['name']:>24}\t\n{'id':>15}: {task['id']:>24}\t\n{'status':>15}: {task['status']['status']:>24}\t\n{'priority':>15}: {priority:>24}\t\n{'time_estimate':>15}: {time_estimate:>24}\t\n{'assignees':>15}: "
-                assignees = task.get('assignees', [])
-                assignees = '\n'.join([assignee['username'] for assignee in assignees])
-                message_content += f" {assignees:>24}\n{'-'*80}\n"
-            
-            message_content += "```"
-            return message_content
-        else:
-            return f"Error '{response.status_code}' getting list tasks: {response.text}"
+        for task in tasks:
+            time_estimate = task.time_estimate/1000 if task.time_estimate else 0
+            message_content += f"{'name':>15}: {task.name:>24}\t\n{'id':>15}: {task.id:>24}\t\n{'status':>15}: {task.status:>24}\t\n{'priority':>15}: {task.priority:>24}\t\n{'time_estimate':>15}: {time_estimate:>24}\t\n{'assignees':>15}: "
+            assignees = '\n'.join(task.assignees)
+            message_content += f" {assignees:>24}\n{'-'*80}\n"
+        
+        message_content += "```"
+        return message_content
+        
+    def commandUpstreamStatus(self) -> str:
+        status_repr = f"```sql\n{'upstream':>10} {'endpoint':>10} {'state':>10} {'failures':>9}\n"
+        for (upstream, endpoint_class), breaker in sorted(self.circuit_breakers.items()):
+            status_repr += f"{upstream:>10} {endpoint_class:>10} {breaker.State:>10} {breaker.failures:>9}\n"
         
+        status_repr += "```"
+        return status_repr
+    
+    def commandSendStats(self) -> str:
+        stats_repr = f"```sql\n{'channel':>20} {'queued':>7} {'sent':>6} {'sends':>6} {'avg_latency':>12} {'max_latency':>12}\n"
+        for channel_id, outbox in self.outbound.outboxes.items():
+            channel = self.get_channel(channel_id)
+            channel_name = channel.name if channel is not None else str(channel_id)
+            average_latency = outbox.total_latency / outbox.sent_messages if outbox.sent_messages else 0
+            stats_repr += f"{channel_name[:20]:>20} {len(outbox.messages):>7} {outbox.sent_messages:>6} {outbox.sends:>6} {average_latency:>11.2f}s {outbox.max_latency:>11.2f}s\n"
+        
+        idle_totals = self.outbound.idle_totals
+        if idle_totals.sends:
+            average_latency = idle_totals.total_latency / idle_totals.sent_messages if idle_totals.sent_messages else 0
+            stats_repr += f"{'(idle channels)':>20} {0:>7} {idle_totals.sent_messages:>6} {idle_totals.sends:>6} {average_latency:>11.2f}s {idle_totals.max_latency:>11.2f}s\n"
+        
+        stats_repr += "```"
+        return stats_repr
+    
+    async def commandWorkload(self, refresh:bool, message_obj: discord.Message) -> None:
+        server_data = self.Servers.get(str(message_obj.guild.id), {})
+        list_names = {str(list_data["id"]): list_data["name"] for list_data in server_data.get("click_up", {}).get("lists", [])}
+        list_ids = list(list_names)
+        if not list_ids:
+            self.sendMessage(message_obj.channel, "```arm\nNo lists saved\n```")
+            return
+        
+        # only lists without a table or with one older than the cache ttl are requested, the rest come from the precomputed tables
+        outdated_list_ids = [list_id for list_id in list_ids if refresh or self.workload.age(list_id) is None or self.workload.age(list_id) >= self.cache.ttl]
+        failed_lists = {}
+        if outdated_list_ids:
+            fetched_tasks = await asyncio.gather(*[self.runUpstream(self.getListTasks, list_id, False, refresh) for list_id in outdated_list_ids], return_exceptions=True)
+            for list_id, tasks in zip(outdated_list_ids, fetched_tasks):
+                cached_tasks = self.cache.peek("list_tasks", f"{list_id}:False")
+                if isinstance(tasks, Exception) or isinstance(tasks, StaleRecords) or cached_tasks is None:
+                    failed_lists[list_id] = f"{type(tasks).__name__}" if isinstance(tasks, Exception) else "upstream error"
+                    continue
+                # cache hits skip storeListTasks, so the table is rebuilt with the cached fetch time
+                self.workload.updateList(list_id, tasks, cached_tasks.fetched_at)
+        
+        totals = self.workload.totals(list_ids)
+        workload_repr = ""
+        missing_lists = [list_id for list_id in list_ids if self.workload.age(list_id) is None]
+        stale_lists = [list_id for list_id in failed_lists if list_id not in missing_lists]
+        if missing_lists:
+            missing_repr = ", ".join(f"{list_names[list_id]} ({failed_lists.get(list_id, 'no data')})" for list_id in missing_lists)
+            workload_repr += f"```arm\nNot included, fetching failed: {missing_repr}\n```"
+        if stale_lists:
+            workload_repr += f"```arm\nRefresh failed, using older data: {', '.join(list_names[list_id] for list_id in stale_lists)}\n```"
+        
+        workload_repr += "```sql\n"
+        workload_repr += f"{'list':<24} {'data age':>10}\n"
+        for list_id in list_ids:
+            list_age = self.workload.age(list_id)
+            list_age_repr = "missing" if list_age is None else f"{list_age / 60:.0f}m"
+            workload_repr += f"{list_names[list_id][:24]:<24} {list_age_repr:>10}\n"
+        workload_repr += f"{'-'*46}\n"
+        
+        for dimension in WorkloadTable.DIMENSIONS:
+            workload_repr += f"{dimension:<24} {'open tasks':>10} {'estimate':>10}\n"
+            for key, (count, estimate) in sorted(totals[dimension].items(), key=lambda item: item[1][1], reverse=True):
+                workload_repr += f"{str(key)[:24]:<24} {count:>10} {estimate / (60 * 60 * 1000):>9.1f}h\n"
+            workload_repr += f"{'-'*46}\n"
+        
+        workload_repr += "```"
+        self.sendMessage(message_obj.channel, workload_repr)
+    
     async def commandSaveClickUpList(self, list_id:int, message_obj: discord.Message) -> None:
         clickup_url = f"https://api.clickup.com/api/v2/list/{list_id}"
         
@@ -275,25 +1110,26 @@ class DiscordBot(discord.Client):
             'Content-Type': 'application/json'
         }
         
-        response = session.get(clickup_url, headers=headers)
+        response = self.upstreamRequest("clickup", "lists", "GET", clickup_url, session=session, headers=headers)
         
         if response.ok and self.config["servers_data"].get(str(message_obj.guild.id), False):
-            list_data = json.loads(response.text)
+            list_data = decodeJson(response.content)
+            list_data = {"id": list_data["id"], "name": list_data["name"]}
             self.config["servers_data"][f"{message_obj.guild.id}"]["click_up"]["lists"].append(list_data)
             self.saveConfig()
             
-            await message_obj.channel.send(f"Saved list {list_data['name']}")
+            self.sendMessage(message_obj.channel, f"Saved list {list_data['name']}")
         elif response.status_code == 404:
-            await message_obj.channel.send(f"```arm\nList {list_id} does not exist\n```")
+            self.sendMessage(message_obj.channel, f"```arm\nList {list_id} does not exist\n```")
         else:
             print(f"Error saving list {list_id}: {response.status_code} - {clickup_url}")
-            await message_obj.channel.send(f"```arm\nError saving list {list_id}\n```")
+            self.sendMessage(message_obj.channel, f"```arm\nError saving list {list_id}\n```")
         
         return
     
     async def commandListClickUpLists(self, message_obj: discord.Message) -> None:
         if not self.config["servers_data"].get(str(message_obj.guild.id), False):
-            await message_obj.channel.send(f"```arm\nNo lists saved\n```")
+            self.sendMessage(message_obj.channel, f"```arm\nNo lists saved\n```")
             return
 
         discord_server = str(message_obj.guild.id)
@@ -304,7 +1140,7 @@ class DiscordBot(discord.Client):
             clickup_lists_messages += f"{list_data['name']} - id:{list_data['id']}\n"
         clickup_lists_messages += "```"
         
-        await message_obj.channel.send(clickup_lists_messages)
+        self.sendMessage(message_obj.channel, clickup_lists_messages)
     
     @property
     def ClickUpToken(self) -> str:
@@ -329,14 +1165,15 @@ class DiscordBot(discord.Client):
             "Content-Type": "application/json"
         }
         
-        response = requests.post(tasks_url, json=form_data, headers=headers)
+        response = self.upstreamRequest("clickup", "tasks", "POST", tasks_url, json=form_data, headers=headers)
         return_data = {}
         if response.status_code < 300:
-            return_data = json.loads(response.text)
+            return_data = decodeJson(response.content)
+            self.invalidateListTasks([list_id])
         
         return return_data
     
-    def createGithubIssue(self, project_name:str, issue_name:str, task_id:str, issue_body:str) -> None:
+    def createGithubIssue(self, project_name:str, issue_name:str, task_id:str, issue_body:str) -> int:
         assert project_name in self.projects, f"Project {project_name} does not exist"
         
         github_repo_name = self.projects[project_name].github_repo_name
@@ -349,13 +1186,19 @@ class DiscordBot(discord.Client):
         
         issue_data = {
             "title": issue_name,
-            "body": f"This issue is created from ClickUp Task #{task_id}: {issue_body}",
-            "labels": ["feature", "clickup"]
+            "body": f"This issue is created from ClickUp Task #{task_id}: {issue_body}" if task_id else issue_body,
+            "labels": ["feature", "clickup"] if task_id else ["feature"]
         }
         
-        response = session.post(github_issue_url, json=issue_data)
+        response = self.upstreamRequest("github", "issues", "POST", github_issue_url, session=session, json=issue_data)
         session.close()
         
+        if response.status_code < 300:
+            self.cache.invalidate("repo_issues", f"{github_repo_name}:")
+        
+        if response.status_code < 300 and task_id and self.linkIssue(task_id, github_repo_name, decodeJson(response.content)["number"]):
+            self.saveIssueLinks()
+        
         return response.status_code
     
     def enableChannel(self, guild_id: str, channel_id: str) -> None:
@@ -379,11 +1222,11 @@ class DiscordBot(discord.Client):
         admin_array = self.Servers[str(message_obj.guild.id)]["admins"]
 
         if new_admin.id in admin_array:
-            await message_obj.channel.send("You are already an admin")
+            self.sendMessage(message_obj.channel, "You are already an admin")
             return
         
         admin_array.append(new_admin.id)
-        await message_obj.channel.send("You are now an admin", delete_after=1560)
+        self.sendMessage(message_obj.channel, "You are now an admin", delete_after=1560)
         self.saveConfig()
 
     @property
@@ -394,47 +1237,143 @@ class DiscordBot(discord.Client):
     def GitHubUser(self) -> str:
         return self.credentials["github_user"]
 
-    def getGithubUserData(self, user_name:str) -> Dict:
+    def getGithubUserData(self, user_name:str, refresh:bool=False) -> Dict:
+        cached_user = None if refresh else self.cache.get("github_users", user_name)
+        if cached_user is not None:
+            return cached_user.value
+        
         session = requests.session()
         session.auth = (self.GitHubUser, self.GitHubToken)
         
         github_user_url = f"https://api.github.com/users/{user_name}"
-        response = session.get(github_user_url)
+        response = self.upstreamRequest("github", "users", "GET", github_user_url, session=session)
         session.close()
         
         if response.status_code == 404:
             return None
+        
+        # outages surface as an upstream failure in on_message instead of a decode error
+        response.raise_for_status()
 
-        user_data = json.loads(response.text)
+        user_data = decodeJson(response.content)
+        user_data = {"login": user_data["login"], "html_url": user_data["html_url"]}
+        self.cache.set("github_users", user_name, user_data)
         
         return user_data
     
+    def findTaskLists(self, task_id:str) -> Optional[List[str]]:
+        """ Returns the ids of the cached lists holding the task, None if no cached list has it """
+        list_ids = {key.rsplit(":", 1)[0] for key, entry in self.cache.entries("list_tasks") if any(task.id == task_id for task in entry.value)}
+        return list(list_ids) or None
+    
     def getDevelopers(self, project_name:str) -> List:
         assert project_name in self.projects, f"Project {project_name} does not exist"
         
         developers = self.projects[project_name].assignees
         return developers
     
-    def getProjectIssues(self, project_name:str) -> List:
+    def getProjectIssues(self, project_name:str, state:str=None, refresh:bool=False) -> List[IssueRecord]:
         if project_name not in self.projects:
             print(f"Project {project_name} does not exist")
             return []
         
-        github_repo_name = self.projects[project_name].github_repo_name
+        return self.getRepoIssues(self.projects[project_name].github_repo_name, state, refresh)
+    
+    def getRepoIssues(self, github_repo_name:str, state:str=None, refresh:bool=False) -> List[IssueRecord]:
+        cache_key = f"{github_repo_name}:{state or 'open'}"
+        cached_issues = None if refresh else self.cache.get("repo_issues", cache_key)
+        if cached_issues is not None:
+            return StaleRecords(cached_issues.value) if self.cache.isOutdated(cached_issues) else cached_issues.value
+        
         github_issues_url = f"https://api.github.com/repos/{self.GitHubUser}/{github_repo_name}/issues"
         print("Github issues url:", github_issues_url)
         
         session = requests.session()
         session.auth = (self.GitHubUser, self.GitHubToken)
         
-        response = session.get(github_issues_url)
-        session.close()
+        params = {"per_page": 100}
+        if state:
+            params["state"] = state
         
         issues_data = []
-        if response.status_code != 404:
-            issues_data = json.loads(response.text)
+        try:
+            while github_issues_url:
+                response = self.upstreamRequest("github", "issues", "GET", github_issues_url, session=session, params=params)
+                if not response.ok:
+                    break
+                
+                issues_data.extend(parseIssues(response.content))
+                # the next page link already carries the query parameters
+                github_issues_url = response.links.get("next", {}).get("url")
+                params = None
+        except (UpstreamUnavailable, requests.RequestException):
+            stale_issues = self.cache.peek("repo_issues", cache_key)
+            if stale_issues is None:
+                raise
+            return StaleRecords(stale_issues.value)
+        finally:
+            session.close()
+        
+        if response.ok:
+            self.cache.set("repo_issues", cache_key, issues_data)
+        elif response.status_code != 404 and self.cache.peek("repo_issues", cache_key) is not None:
+            issues_data = StaleRecords(self.cache.peek("repo_issues", cache_key).value)
+        else:
+            issues_data = []
         
         return issues_data
+    
+    def getRepoClosedIssueCount(self, github_repo_name:str, refresh:bool=False) -> Optional[int]:
+        """ Counts closed issues with a single search request instead of paging through all of them """
+        cached_count = None if refresh else self.cache.get("repo_closed_counts", github_repo_name)
+        if cached_count is not None:
+            return cached_count.value
+        
+        session = requests.session()
+        session.auth = (self.GitHubUser, self.GitHubToken)
+        params = {"q": f"repo:{self.GitHubUser}/{github_repo_name} type:issue state:closed", "per_page": 1}
+        try:
+            response = self.upstreamRequest("github", "search", "GET", "https://api.github.com/search/issues", session=session, params=params)
+        finally:
+            session.close()
+        
+        if not response.ok:
+            stale_count = self.cache.peek("repo_closed_counts", github_repo_name)
+            return stale_count.value if stale_count is not None else None
+        
+        closed_issue_count = decodeJson(response.content)["total_count"]
+        self.cache.set("repo_closed_counts", github_repo_name, closed_issue_count)
+        return closed_issue_count
+    
+    def getProjectTasks(self, project_name:str, include_closed:bool=False) -> List[TaskRecord]:
+        if project_name not in self.projects:
+            print(f"Project {project_name} does not exist")
+            return []
+        
+        return self.getListTasks(self.projects[project_name].clickup_id, include_closed)
+    
+    def getListTasks(self, list_id:str, include_closed:bool=False, refresh:bool=False) -> List[TaskRecord]:
+        cache_key = f"{list_id}:{include_closed}"
+        cached_tasks = None if refresh else self.cache.get("list_tasks", cache_key)
+        if cached_tasks is not None:
+            return StaleRecords(cached_tasks.value) if self.cache.isOutdated(cached_tasks) else cached_tasks.value
+        
+        try:
+            tasks_data, response = self.requestListTasks(list_id, include_closed)
+        except (UpstreamUnavailable, requests.RequestException):
+            stale_tasks = self.cache.peek("list_tasks", cache_key)
+            if stale_tasks is None:
+                raise
+            return StaleRecords(stale_tasks.value)
+        
+        if tasks_data is not None:
+            self.storeListTasks(list_id, include_closed, tasks_data)
+        elif response.status_code != 404 and self.cache.peek("list_tasks", cache_key) is not None:
+            tasks_data = StaleRecords(self.cache.peek("list_tasks", cache_key).value)
+        else:
+            tasks_data = []
+        
+        return tasks_data
 
     @property
     def Help(self) -> str:
@@ -443,11 +1382,24 @@ class DiscordBot(discord.Client):
         help_message += '''
         ${bot_name} status - check if the bot is enabled in this channel
         ${bot_name} list-projects - list all projects
-        ${bot_name} project-tasks - list all tasks for a project
+        ${bot_name} project-tasks project_name [--refresh] - list all tasks for a project
+        ${bot_name} overview - summary of tasks and issues for every project
         '''
+        help_message += f"ClickUp and GitHub data is cached for {self.cache.ttl:g}s, use --refresh to see changes made there right away\n"
         
         return help_message
     
+    def invalidateListTasks(self, list_ids:Optional[List[str]]) -> None:
+        """ Drops the cached tasks and workload tables of the lists, or of every list when list_ids is None """
+        if list_ids is None:
+            self.cache.invalidate("list_tasks")
+            self.workload.clear()
+            return
+        
+        for list_id in list_ids:
+            self.cache.invalidate("list_tasks", f"{list_id}:")
+            self.workload.dropList(list_id)
+    
     def isChannelEnabled(self, guild_id: str, channel_id: str) -> bool:
         is_enabled = False
         guild_id = guild_id if type(guild_id) is str else str(guild_id)
@@ -475,6 +1427,69 @@ class DiscordBot(discord.Client):
         if path.exists(path.join(self.data_path, "team_members.json")):
             print("Loading team members file")
             self.loadTeamMembers()
+        
+        if path.exists(path.join(self.data_path, "issue_links.json")):
+            print("Loading issue links file")
+            self.loadIssueLinks()
+        
+        if path.exists(path.join(self.data_path, "cache_snapshot.json.gz")):
+            print("Loading cache snapshot")
+            self.loadCacheSnapshot()
+    
+    def linkIssue(self, task_id:str, github_repo_name:str, issue_number:int) -> bool:
+        """ Links a task and an issue, returns False if the link was already known. Only call from the event loop thread
+        
+        Every issue keeps its task, a task keeps pointing to the first issue linked to it.
+        """
+        link = IssueLink(task_id, github_repo_name, int(issue_number))
+        if self.task_by_issue.get(link.IssueKey) == task_id:
+            return False
+        
+        self.task_by_issue[link.IssueKey] = task_id
+        self.issue_links.setdefault(task_id, link)
+        return True
+    
+    def scanIssueLinks(self, project_names:List[str]) -> List[tuple]:
+        """ Reads every issue of the projects and returns the (task_id, repo, issue_number) references found, oldest issue first """
+        scanned_links = []
+        for project_name in project_names:
+            if project_name not in self.projects:
+                continue
+            
+            github_repo_name = self.projects[project_name].github_repo_name
+            for issue in sorted(self.getRepoIssues(github_repo_name, "all", refresh=True), key=lambda issue: issue.number):
+                if issue.clickup_task_id:
+                    scanned_links.append((issue.clickup_task_id, github_repo_name, issue.number))
+        
+        return scanned_links
+    
+    def loadCacheSnapshot(self) -> None:
+        snapshot_file = path.join(self.data_path, "cache_snapshot.json.gz")
+        
+        if not path.exists(snapshot_file):
+            return
+        
+        try:
+            with open(snapshot_file, "rb") as f:
+                restored = self.cache.load(f.read())
+        except Exception as e:
+            print(f"Error loading cache snapshot, starting cold: {e}")
+            return
+        
+        self.cache.revalidating = restored > 0
+        print(f"restored {restored} cache entries")
+    
+    def loadIssueLinks(self) -> None:
+        issue_links_file = path.join(self.data_path, "issue_links.json")
+        
+        if not path.exists(issue_links_file):
+            return
+        
+        with open(issue_links_file) as f:
+            for link_data in json.load(f):
+                self.linkIssue(**link_data)
+        
+        print(f"loaded {len(self.issue_links)} issue links")
     
     def loadTeamMembers(self) -> None:
         team_members_file = path.join(self.data_path, "team_members.json")
@@ -532,16 +1547,22 @@ class DiscordBot(discord.Client):
             
             if message.content.startswith(f"${self.bot_name} status"):
                 response:str = f"Channel {message.channel.name} is: {'enabled' if self.isChannelEnabled(message.guild.id, message.channel.id) else 'disabled'}"
-                await message.channel.send(response)
+                self.sendMessage(message.channel, response)
                 
             elif message.content.startswith(f"${self.bot_name} enable") and self.isUserAdmin(message):
                 print(f"Enabling channel {message.channel.name} by request of {message.author.name}")
                 if not self.isChannelEnabled(message.guild.id, message.channel.id):
                     self.enableChannel(message.guild.id, message.channel.id)
-                await message.channel.send(f"Channel {message.channel.name} is now enabled")
+                self.sendMessage(message.channel, f"Channel {message.channel.name} is now enabled")
     
             elif self.isChannelEnabled(message.guild.id, message.channel.id):
-                await self.runCommand(message.content, message)
+                try:
+                    await self.runProfiledCommand(message.content, message)
+                except UpstreamUnavailable as e:
+                    self.sendMessage(message.channel, f"```arm\n{e}, please try again later\n```")
+                except requests.RequestException as e:
+                    print(f"Upstream request failed: {e}")
+                    self.sendMessage(message.channel, f"```arm\nUpstream request failed: {type(e).__name__}, please try again later\n```")
         
         elif message.content == self.passphrase:
             print(f"ENABLE REQUEST: from guild '{message.guild.name}' for channel '{message.channel.name}'")
@@ -549,7 +1570,7 @@ class DiscordBot(discord.Client):
             if not self.isChannelEnabled(message.guild.id, message.channel.id):
                 self.enableChannel(message.guild.id, message.channel.id)
                 print(f"ENABLED CHANNEL: {message.channel.name}")
-                await message.channel.send(f"bot commands enable for channel '{message.channel.name}' in discord server '{message.guild.name}'")
+                self.sendMessage(message.channel, f"bot commands enable for channel '{message.channel.name}' in discord server '{message.guild.name}'")
 
         elif message.content == self.admin_passphrase:
             print(f"ADMIN ADD REQUEST: from guild '{message.guild.name}' for channel '{message.channel.name}'")
@@ -571,7 +1592,8 @@ class DiscordBot(discord.Client):
                     "admins": [],
                     "click_up": {
                         "lists": []
-                    }
+                    },
+                    "boards": {}
                 }
                 
                 for channel in guild.channels:
@@ -585,39 +1607,211 @@ class DiscordBot(discord.Client):
         if changed:
             self.saveConfig()
         
+        if not self.background_tasks:
+            # on_ready runs again after reconnects, background loops only start once
+            self.background_tasks.append(asyncio.create_task(self.revalidateCache()))
+            self.background_tasks.append(asyncio.create_task(self.snapshotCachePeriodically()))
+            self.background_tasks.append(asyncio.create_task(self.refreshBoardsPeriodically()))
+        
         print(f"Bot is ready!")
     
     def parseCommand(self, command:str) -> str:
         print(f"Parsing command: {command} into {command.replace(self.CommandPrefix, '')}")
         return shlex.split(command.replace(self.CommandPrefix, ""))
     
+    async def refreshBoard(self, guild_id:str, project_name:str, force:bool=False) -> None:
+        """ Edits a board message only if its content changed, adapting how often the board is refreshed """
+        board = self.Servers[guild_id]["boards"][project_name]
+        if project_name not in self.projects:
+            print(f"Removing board for deleted project {project_name}")
+            del self.Servers[guild_id]["boards"][project_name]
+            self.saveConfig()
+            return
+        
+        board_content = await self.runUpstream(self.renderBoard, project_name, board["interval"])
+        content_hash = hashlib.sha1(board_content.encode()).hexdigest()
+        
+        if content_hash == board["content_hash"] and not force:
+            # unchanged boards back off up to the max interval
+            board["interval"] = min(board["interval"] * 2, self.board_max_interval)
+        else:
+            try:
+                board_channel = self.get_channel(int(board["channel_id"])) or await self.fetch_channel(int(board["channel_id"]))
+                board_message = await board_channel.fetch_message(int(board["message_id"]))
+                await board_message.edit(content=board_content)
+            except discord.NotFound:
+                print(f"Board message for {project_name} is gone, removing board")
+                del self.Servers[guild_id]["boards"][project_name]
+                self.saveConfig()
+                return
+            
+            board["content_hash"] = content_hash
+            board["interval"] = max(board["interval"] / 4, self.board_min_interval)
+            self.saveConfig()
+        
+        self.board_next_refresh[(guild_id, project_name)] = time.time() + board["interval"]
+    
+    async def refreshBoardsPeriodically(self) -> None:
+        while True:
+            now = time.time()
+            for guild_id, server_data in list(self.Servers.items()):
+                for project_name, board in list(server_data.get("boards", {}).items()):
+                    # boards restored from the config wait one interval before their first refresh
+                    next_refresh = self.board_next_refresh.setdefault((guild_id, project_name), now + board["interval"])
+                    if next_refresh > now:
+                        continue
+                    
+                    try:
+                        await self.refreshBoard(guild_id, project_name)
+                    except Exception as e:
+                        print(f"Error refreshing board {project_name}: {e}")
+                        self.board_next_refresh[(guild_id, project_name)] = now + board["interval"]
+            
+            await asyncio.sleep(self.board_min_interval / 4)
+    
+    def renderBoard(self, project_name:str, max_age:float=None) -> str:
+        """ Renders a project status board, contains no timestamps so unchanged projects hash the same
+        
+        Cached data younger than max_age is reused, older data is fetched again even if the cache ttl allows it.
+        """
+        project = self.projects[project_name]
+        cached_tasks = self.cache.peek("list_tasks", f"{project.clickup_id}:False")
+        cached_issues = self.cache.peek("repo_issues", f"{project.github_repo_name}:open")
+        refresh_tasks = max_age is not None and (cached_tasks is None or time.time() - cached_tasks.fetched_at >= max_age)
+        refresh_issues = max_age is not None and (cached_issues is None or time.time() - cached_issues.fetched_at >= max_age)
+        
+        all_tasks = self.getListTasks(project.clickup_id, refresh=refresh_tasks)
+        issues = self.getRepoIssues(project.github_repo_name, refresh=refresh_issues)
+        tasks = [task for task in all_tasks if not task.IsClosed]
+        summary = self.summarizeProject(tasks, issues)
+        
+        stale_marker = " (stale, upstream unavailable)" if isinstance(all_tasks, StaleRecords) or isinstance(issues, StaleRecords) else ""
+        board_content = f"**{project_name}** status board{stale_marker}\n```yaml\n"
+        board_content += f"open tasks: {summary['open_tasks']} | open issues: {summary['open_issues']} | unassigned: {summary['unassigned']} | overdue: {summary['overdue']} ({summary['overdue_hours']:.1f}h)\n\n"
+        for task in tasks:
+            board_content += f"- [{task.status}] {task.name} ({', '.join(task.assignees) or 'unassigned'})\n"
+        board_content += "\n"
+        for issue in issues:
+            board_content += f"- #{issue.number} {issue.title} ({', '.join(issue.assignees) or 'unassigned'})\n"
+        
+        if len(board_content) > 1990:
+            board_content = board_content[:1980] + "\n..."
+        
+        return board_content + "```"
+    
+    def requestListTasks(self, list_id:str, include_closed:bool=False) -> tuple:
+        """ Fetches every page of a list's tasks, returns the tasks (None if a page failed) and the last response """
+        clickup_api_url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
+        headers = {
+            'Authorization': self.ClickUpToken,
+            'Content-Type': 'application/json'
+        }
+        
+        tasks = []
+        page = 0
+        while True:
+            params = {"page": page}
+            if include_closed:
+                params["include_closed"] = "true"
+            
+            response = self.upstreamRequest("clickup", "tasks", "GET", clickup_api_url, headers=headers, params=params)
+            if not response.ok:
+                return None, response
+            
+            page_tasks, last_page = parseTasks(response.content)
+            tasks.extend(page_tasks)
+            if last_page:
+                return tasks, response
+            page += 1
+    
+    async def revalidateCache(self) -> None:
+        """ Refreshes the entries restored from the cache snapshot while the stale values keep being served """
+        if not self.cache.revalidating:
+            return
+        
+        semaphore = asyncio.Semaphore(self.overview_concurrency)
+        
+        def refreshEntry(namespace:str, key:str) -> None:
+            match namespace:
+                case "list_tasks":
+                    list_id, include_closed = key.rsplit(":", 1)
+                    self.getListTasks(list_id, include_closed == "True", refresh=True)
+                case "repo_issues":
+                    github_repo_name, state = key.rsplit(":", 1)
+                    self.getRepoIssues(github_repo_name, state, refresh=True)
+                case "clickup_team":
+                    self.commandClickupTeam(refresh=True)
+                case "github_users":
+                    self.getGithubUserData(key, refresh=True)
+                case "repo_closed_counts":
+                    self.getRepoClosedIssueCount(key, refresh=True)
+        
+        async def refreshBounded(namespace:str, key:str) -> None:
+            async with semaphore:
+                try:
+                    await self.runUpstream(refreshEntry, namespace, key)
+                except Exception as e:
+                    print(f"Error revalidating cache entry {namespace}/{key}: {e}")
+        
+        restored_keys = self.cache.restoredKeys()
+        await asyncio.gather(*[refreshBounded(namespace, key) for namespace, key in restored_keys])
+        self.cache.revalidating = False
+        print(f"revalidated {len(restored_keys)} cache entries")
+    
     def run(self, *args, **kwargs):
         return super().run(self.__token, **kwargs)
     
+    def runUpstream(self, function, *args, executor:ThreadPoolExecutor=None) -> asyncio.Future:
+        """ Runs a blocking upstream call on the upstream executor, keeping the caller's context variables """
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(executor or self.upstream_executor, context.run, function, *args)
+    
+    async def runProfiledCommand(self, command: str, message_obj: discord.Message) -> None:
+        profile_session = self.profile_session
+        if profile_session is None or command.startswith(f"{self.CommandPrefix}profile"):
+            await self.runCommand(command, message_obj)
+            return
+        
+        command_upstream = UpstreamTimer()
+        context_token = current_command_upstream.set(command_upstream)
+        command_start = time.perf_counter()
+        try:
+            await self.runCommand(command, message_obj)
+        finally:
+            current_command_upstream.reset(context_token)
+            profile_session.recordCommand(CommandSample(command.replace(self.CommandPrefix, ""), time.perf_counter() - command_start, command_upstream.snapshot()))
+    
     async def runCommand(self, command: str, message_obj: discord.Message) -> None:
         
         match self.parseCommand(command):
             case ["list-projects"]:
                 print("Listing projects")
                 message = self.commandListProjects()
-                await message_obj.channel.send(message)
+                self.sendMessage(message_obj.channel, message)
+                return
+            
+            case ["overview"]:
+                print("Building projects overview")
+                async with message_obj.channel.typing():
+                    await self.commandOverview(message_obj)
                 return
             
             case ["project-tasks", *command_args] if len(command_args) > 0:
                 project_tasks_parser = argparse.ArgumentParser(description="Project tasks")
                 project_tasks_parser.add_argument("project_name", help="Name of the project")
+                project_tasks_parser.add_argument("--refresh", action="store_true", help="Skip the cached tasks")
                 try:
                     project_tasks_args = project_tasks_parser.parse_args(command_args)
                 except Exception as e:
-                    await message_obj.channel.send(f"```arm\nError: {e}\n```")
+                    self.sendMessage(message_obj.channel, f"```arm\nError: {e}\n```")
                     return
                 
                 async with message_obj.channel.typing():
                     message = self.commandListProjectTasks(project_tasks_args)
-                    await message_obj.channel.send(message)
+                    self.sendMessage(message_obj.channel, message)
                     
             case ["help"]:
-                await message_obj.channel.send(self.Help)
+                self.sendMessage(message_obj.channel, self.Help)
             
             case other:
                 await self.runAdminCommands(command, message_obj)
@@ -626,20 +1820,21 @@ class DiscordBot(discord.Client):
     async def runAdminCommands(self, command:str, message_obj: discord.Message) -> None:
         if not self.isUserAdmin(message_obj):
             print(f"Unknown command '{command}'")
-            await message_obj.reply(f"Unknown command '{command}'")
+            self.sendMessage(message_obj.channel, f"Unknown command '{command}'", reference=message_obj)
+            return
         
         match self.parseCommand(command):
             case ["create-project", *project_data] if len(project_data) == 3:
                 # $dexnet create-project project_name clickup_list_id github_repo
                 print(f"Creating project '{project_data[0]}' with description '{project_data[1]}' and url '{project_data[2]}'")
                 self.createProject(project_data[0], project_data[1], project_data[2])
-                await message_obj.channel.send(f"Project '{project_data[0]}' created")
+                self.sendMessage(message_obj.channel, f"Project '{project_data[0]}' created")
                 return
             
             case ["create-member", *member_data] if len(member_data) >= 2:
                 # $dexnet create-member member_clickup_id member_github_account
                 if len(message_obj.mentions) == 0:
-                    await message_obj.channel.send(f"Please mention the member to add")
+                    self.sendMessage(message_obj.channel, f"Please mention the member to add")
                     return
                 
                 create_member_parser = argparse.ArgumentParser(description="Create member")
@@ -651,14 +1846,14 @@ class DiscordBot(discord.Client):
                     if create_member_args.member_clickup_id.startswith("<@"):
                         raise Exception("Incorrect parameters order please follow the next format: $dexnet create-member member_clickup_id member_github_account @member_mention")
                 except Exception as e:
-                    await message_obj.channel.send(f"```arm\nError: {e}\n```")
+                    self.sendMessage(message_obj.channel, f"```arm\nError: {e}\n```")
                     return
                 
                 
                 create_member_args.discord_username = message_obj.mentions[0].name
                 create_member_args.server_id = message_obj.guild.id
                 message = self.commandCreateMember(create_member_args)
-                await message_obj.channel.send(message, reference=message_obj)
+                self.sendMessage(message_obj.channel, message, reference=message_obj)
                 
                 
             case ["new-feature", *issue_data] if len(issue_data) == 3:
@@ -679,9 +1874,9 @@ class DiscordBot(discord.Client):
                 # $dexnet set-assignee project_name issue_id github_user
                 print(f"Setting assignee for issue '{issue_id}' in project '{project_name}' to '{github_user}'")
                 if self.setAssignee(project_name, issue_id, github_user):
-                    await message_obj.channel.send(f"Assignee for issue '{issue_id}' in project '{project_name}' set to '{github_user}'")
+                    self.sendMessage(message_obj.channel, f"Assignee for issue '{issue_id}' in project '{project_name}' set to '{github_user}'")
                 else:
-                    await message_obj.channel.send(f"Assignee for issue '{issue_id}' in project '{project_name}' not set")
+                    self.sendMessage(message_obj.channel, f"Assignee for issue '{issue_id}' in project '{project_name}' not set")
                 return
             
             case ["list-devs", project_name]:
@@ -690,20 +1885,20 @@ class DiscordBot(discord.Client):
                 await self.commandListDevelopers(project_name, message_obj)
                 return
             
-            case ["list-issues", project_name]:
-                # $dexnet list-issues project_name
+            case ["list-issues", project_name, *flags] if flags in ([], ["--refresh"]):
+                # $dexnet list-issues project_name [--refresh]
                 print(f"Listing issues for project '{project_name}'")
-                await self.commandListIssues(project_name, message_obj)
+                await self.commandListIssues(project_name, message_obj, refresh=bool(flags))
                 
-            case ["create-issue", project_name, issue_name, issue_body]:
-                # $dexnet create-issue project_name issue_title issue_body
+            case ["create-issue", project_name, issue_name, issue_body, *task_id] if len(task_id) <= 1:
+                # $dexnet create-issue project_name issue_title issue_body [clickup_task_id]
                 print(f"Creating issue '{issue_name}' in project '{project_name}'")
-                status_code = self.createGithubIssue(project_name, issue_name, issue_body)
+                status_code = self.createGithubIssue(project_name, issue_name, task_id[0] if task_id else None, issue_body)
                 
                 if status_code < 300:
-                    await message_obj.channel.send(f"Issue '{issue_name}' created")
+                    self.sendMessage(message_obj.channel, f"Issue '{issue_name}' created")
                 else:
-                    await message_obj.channel.send(f"Issue '{issue_name}' creation failed")
+                    self.sendMessage(message_obj.channel, f"Issue '{issue_name}' creation failed")
                 return
             
             case ["create-task", *command_args] if len(command_args) >= 3:
@@ -719,19 +1914,72 @@ class DiscordBot(discord.Client):
                 try:
                     args = create_task_parser.parse_args(command_args)                    
                 except SystemExit as e:
-                    await message_obj.channel.send(f"Invalid arguments for create-task command: {e}")
+                    self.sendMessage(message_obj.channel, f"Invalid arguments for create-task command: {e}")
                     return
                 
                 args.time *= 1000 # convert to milliseconds
                 print(f"Creating task '{args.task_name}'")
                 message = self.commandCreateTask(args)
-                await message_obj.channel.send(message)
+                self.sendMessage(message_obj.channel, message)
+            
+            case ["task-issue", task_id]:
+                # $dexnet task-issue clickup_task_id
+                self.sendMessage(message_obj.channel, self.commandLinkedIssue(task_id))
             
-            case ["clickup-team"]:
-                # $dexnet clickup-team
+            case ["issue-task", project_name, issue_number]:
+                # $dexnet issue-task project_name issue_number
+                self.sendMessage(message_obj.channel, self.commandLinkedTask(project_name, issue_number))
+            
+            case ["scan-links", *project_names]:
+                # $dexnet scan-links [project_name...]
+                print("Scanning github issues for clickup task links")
+                async with message_obj.channel.typing():
+                    # only the fetching runs on the executor, the index is updated and saved on the event loop
+                    scanned_links = await self.runUpstream(self.scanIssueLinks, project_names or list(self.projects))
+                    self.sendMessage(message_obj.channel, self.commandScanIssueLinks(scanned_links))
+            
+            case ["profile", *profile_args]:
+                # $dexnet profile [-s seconds] [-c commands] [-i interval]
+                profile_parser = argparse.ArgumentParser(description="Profile the bot", usage="$dexnet profile [-s seconds] [-c commands] [-i interval]")
+                profile_parser.add_argument("-s", "--seconds", type=float, default=60, help="Maximum time to profile for")
+                profile_parser.add_argument("-c", "--commands", type=int, default=50, help="Stop after this many commands")
+                profile_parser.add_argument("-i", "--interval", type=float, default=0.01, help=f"Seconds between stack samples, at least {MIN_PROFILE_INTERVAL}")
+                try:
+                    profile_namespace = profile_parser.parse_args(profile_args)
+                except SystemExit as e:
+                    self.sendMessage(message_obj.channel, f"Invalid arguments for profile command: {e}")
+                    return
+                
+                if profile_namespace.seconds <= 0 or profile_namespace.commands <= 0 or profile_namespace.interval < MIN_PROFILE_INTERVAL:
+                    # a tiny interval turns the sampler into a busy loop holding the GIL
+                    self.sendMessage(message_obj.channel, f"```arm\nseconds and commands must be positive and interval at least {MIN_PROFILE_INTERVAL}\n```")
+                    return
+                
+                await self.commandProfile(profile_namespace, message_obj)
+            
+            case ["pin-board", project_name]:
+                # $dexnet pin-board project_name
+                print(f"Pinning status board for project '{project_name}'")
+                await self.commandPinBoard(project_name, message_obj)
+            
+            case ["upstream-status"]:
+                # $dexnet upstream-status
+                self.sendMessage(message_obj.channel, self.commandUpstreamStatus())
+            
+            case ["send-stats"]:
+                # $dexnet send-stats
+                self.sendMessage(message_obj.channel, self.commandSendStats())
+            
+            case ["workload", *workload_args] if workload_args in ([], ["--refresh"]):
+                # $dexnet workload [--refresh]
+                print("Building workload report")
+                await self.commandWorkload(bool(workload_args), message_obj)
+            
+            case ["clickup-team", *flags] if flags in ([], ["--refresh"]):
+                # $dexnet clickup-team [--refresh]
                 with message_obj.channel.typing():
-                    message = self.commandClickupTeam()
-                    await message_obj.channel.send(message)
+                    message = self.commandClickupTeam(refresh=bool(flags))
+                    self.sendMessage(message_obj.channel, message)
             
             case ["save-list", list_id]:
                 # $dexnet save-list list_id
@@ -747,7 +1995,7 @@ class DiscordBot(discord.Client):
                 namespace = argparse.Namespace(list_id=list_id)
                 print(f"Listing members for list '{list_id}'")
                 message = self.commandGetListMemebers(namespace)
-                await message_obj.channel.send(message)
+                self.sendMessage(message_obj.channel, message)
             
             case ["task-assign", *task_assign_args] if len(task_assign_args) >= 2:
                 # $dexnet task-assign task_id -a clickup_user_id...
@@ -758,17 +2006,17 @@ class DiscordBot(discord.Client):
                     print(task_assign_args)
                     task_assign_namespace = task_assign_parser.parse_args(task_assign_args)
                 except SystemExit as e:
-                    await message_obj.channel.send(f"Invalid arguments for task-assign command: {e}")
+                    self.sendMessage(message_obj.channel, f"Invalid arguments for task-assign command: {e}")
                     return
 
                 message = self.commandAssignTask(task_assign_namespace)
-                await message_obj.channel.send(message)
+                self.sendMessage(message_obj.channel, message)
 
             case ["admin-help"]:
-                await message_obj.channel.send(f"```sql\n{self.AdminHelp}```")
+                self.sendMessage(message_obj.channel, f"```sql\n{self.AdminHelp}```")
             case other:
                 print(f"Unknown command '{command}'")
-                await message_obj.reply(f"Unknown command '{other}'")
+                self.sendMessage(message_obj.channel, f"Unknown command '{other}'", reference=message_obj)
     
     @property
     def AdminHelp(self) -> str:
@@ -779,14 +2027,24 @@ class DiscordBot(discord.Client):
         \t{self.CommandPrefix}new-dev project_name github_username - Add a new developer to a project
         \t{self.CommandPrefix}set-assignee project_name issue_id github_user - Set the assignee for an issue on github
         \t{self.CommandPrefix}list-devs project_name - List all developers for a project
-        \t{self.CommandPrefix}list-issues project_name - List all github issues for a project
-        \t{self.CommandPrefix}create-issue project_name issue_title issue_body - Create a new github issue and links it to a clickup task
+        \t{self.CommandPrefix}list-issues project_name [--refresh] - List all github issues for a project
+        \t{self.CommandPrefix}create-issue project_name issue_title issue_body [clickup_task_id] - Create a new github issue and links it to a clickup task
+        \t{self.CommandPrefix}task-issue clickup_task_id - Show the github issue linked to a clickup task
+        \t{self.CommandPrefix}issue-task project_name issue_number - Show the clickup task linked to a github issue
+        \t{self.CommandPrefix}scan-links [project_name...] - Index task links found in existing github issues
         \t{self.CommandPrefix}create-task list_id task_name task_description - Create a new task on a clickup list
         \t{self.CommandPrefix}save-list list_id - Save a clickup list to the database
         \t{self.CommandPrefix}list-lists - List all clickup lists
         \t{self.CommandPrefix}list-members list_id - List all members of a clickup list
         \t{self.CommandPrefix}admin-help - List all admin commands, only visible to admins
         \t{self.CommandPrefix}task-assign task_id -a clickup_user_id... - Assign a task to a user on clickup
+        \t{self.CommandPrefix}pin-board project_name - Pin a status board for a project that updates itself
+        \t{self.CommandPrefix}workload [--refresh] - Open tasks and estimated time per assignee, status and priority across saved lists
+        \t{self.CommandPrefix}upstream-status - Show the circuit breaker state of every upstream endpoint
+        \t{self.CommandPrefix}send-stats - Show outbound message queue depth and send latency per channel
+        \t{self.CommandPrefix}profile [-s seconds] [-c commands] [-i interval] - Profile cpu and memory usage and attach a report
+        \t{self.CommandPrefix}clickup-team [--refresh] - List the members of the clickup team
+        \tClickUp and GitHub data is cached for {self.cache.ttl:g}s, --refresh skips the cache
         '''    
         
         return help_msg
@@ -801,6 +2059,10 @@ class DiscordBot(discord.Client):
             json.dump(self.config, f, indent=4)
         return
     
+    def sendMessage(self, channel, content:Optional[str]=None, coalesce:bool=True, **kwargs) -> asyncio.Future:
+        """ Queues a message on the channel's outbox so handlers don't wait on discord's rate limits """
+        return self.outbound.put(channel, content, coalesce=coalesce, **kwargs)
+    
     def setAssignee(self, project_name:str, issue:int, github_user:str) -> bool:
         if project_name not in self.projects:
             return False
@@ -816,11 +2078,94 @@ class DiscordBot(discord.Client):
             "assignees": [github_user]
         }
         
-        response = session.post(github_url, json=issue_data)
+        response = self.upstreamRequest("github", "issues", "POST", github_url, session=session, json=issue_data)
         session.close()
         print(f"Response: {response.content}")
+        if response.status_code < 300:
+            self.cache.invalidate("repo_issues", f"{github_repo}:")
         return response.status_code < 300 
         
+    def storeListTasks(self, list_id:str, include_closed:bool, tasks:List[TaskRecord]) -> None:
+        self.cache.set("list_tasks", f"{list_id}:{include_closed}", tasks)
+        self.workload.updateList(list_id, tasks)
+    
+    def summarizeProject(self, tasks:List[TaskRecord], issues:List[IssueRecord], closed_issue_count:int=None) -> Dict:
+        """ Counts closed issues from the issues list unless closed_issue_count is given """
+        now_ms = time.time() * 1000
+        summary = {
+            "open_tasks": 0,
+            "closed_tasks": 0,
+            "open_issues": 0,
+            "closed_issues": 0,
+            "unassigned": 0,
+            "overdue": 0,
+            "overdue_hours": 0.0
+        }
+        
+        for task in tasks:
+            summary["closed_tasks" if task.IsClosed else "open_tasks"] += 1
+            if task.IsClosed:
+                continue
+            
+            if not task.assignees:
+                summary["unassigned"] += 1
+            
+            if task.due_date and task.due_date < now_ms:
+                summary["overdue"] += 1
+                summary["overdue_hours"] += task.time_estimate / (60 * 60 * 1000)
+        
+        for issue in issues:
+            is_closed = issue.state == "closed"
+            summary["closed_issues" if is_closed else "open_issues"] += 1
+            if not is_closed and not issue.assignees:
+                summary["unassigned"] += 1
+        
+        if closed_issue_count is not None:
+            summary["closed_issues"] = closed_issue_count
+        
+        return summary
+    
+    def saveCacheSnapshot(self) -> None:
+        snapshot_file = path.join(self.data_path, "cache_snapshot.json.gz")
+        snapshot_payload = self.cache.dump()
+        
+        with open(f"{snapshot_file}.tmp", "wb") as f:
+            f.write(snapshot_payload)
+        replace(f"{snapshot_file}.tmp", snapshot_file)
+        return
+    
+    async def snapshotCachePeriodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.cache_snapshot_interval)
+            try:
+                # serializing, compressing and writing the snapshot stays off the event loop
+                await asyncio.get_running_loop().run_in_executor(None, self.saveCacheSnapshot)
+            except Exception as e:
+                print(f"Error saving cache snapshot: {e}")
+    
+    async def close(self) -> None:
+        for background_task in list(self.background_tasks):
+            background_task.cancel()
+        
+        try:
+            self.saveCacheSnapshot()
+        except Exception as e:
+            print(f"Error saving cache snapshot: {e}")
+        
+        await super().close()
+    
+    def saveIssueLinks(self) -> None:
+        issue_links_file = path.join(self.data_path, "issue_links.json")
+        with open(issue_links_file, "w") as f:
+            # first links go first so reloading keeps them as each task's issue
+            links = [link.asdict() for link in self.issue_links.values()]
+            for issue_key, task_id in self.task_by_issue.items():
+                github_repo_name, issue_number = issue_key.rsplit("#", 1)
+                if self.issue_links[task_id].IssueKey != issue_key:
+                    links.append(IssueLink(task_id, github_repo_name, int(issue_number)).asdict())
+            json.dump(links, f, indent=4)
+        return
+    
     def saveProjects(self) -> None:
         projects_file = path.join(self.data_path, "projects.json")
         projects_data = {}
@@ -831,12 +2176,40 @@ class DiscordBot(discord.Client):
             json.dump(projects_data, f, indent=4)
         return
     
+    def upstreamRequest(self, upstream:str, endpoint_class:str, method:str, url:str, session:requests.Session=None, **kwargs) -> requests.Response:
+        breaker = self.circuit_breakers.get((upstream, endpoint_class))
+        if breaker is None:
+            breaker = self.circuit_breakers.setdefault((upstream, endpoint_class), CircuitBreaker(self.breaker_failure_threshold, self.breaker_reset_timeout))
+        
+        retry_in = breaker.allowRequest()
+        if retry_in:
+            raise UpstreamUnavailable(upstream, endpoint_class, retry_in)
+        
+        request_start = time.perf_counter()
+        try:
+            response = (session or requests).request(method, url, timeout=self.upstream_timeout, **kwargs)
+        except Exception:
+            # any failure of the request, not only network errors, must release a half-open probe
+            breaker.recordFailure()
+            raise
+        finally:
+            command_upstream = current_command_upstream.get()
+            if command_upstream is not None:
+                command_upstream.add(f"{upstream}/{endpoint_class}", time.perf_counter() - request_start)
+        
+        if response.status_code >= 500 or response.status_code == 429:
+            breaker.recordFailure()
+        else:
+            breaker.recordSuccess()
+        
+        return response
+    
     def verifyGithubUser(self, github_user:str) -> bool:
         session = requests.session()
         session.auth = (self.GitHubUser, self.GitHubToken)
         
         github_user_url = f"https://api.github.com/users/{github_user}"
-        response = session.get(github_user_url)
+        response = self.upstreamRequest("github", "users", "GET", github_user_url, session=session)
         session.close()
         
         return response.status_code == 200